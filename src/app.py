@@ -4,12 +4,14 @@ import sys
 from dotenv import load_dotenv
 import time
 import json
+import uuid
 from datetime import datetime
 
 # Add src to path for imports
 sys.path.append('src')
 from workflow import ContentWorkflow
 from logger import setup_logger
+from exporter import save_run, iter_runs, export_runs, prune_exports, format_text_export
 
 # Load environment variables
 load_dotenv()
@@ -176,6 +178,11 @@ if generate_btn and topic and openrouter_key:
                 "visual_style": "Professional",
 
             }
+            try:
+                save_run(export_data)
+            except Exception as e:
+                logger.error(f"Saving run for bulk export failed: {str(e)}")
+                st.warning("⚠️ Post could not be saved for bulk export - single downloads still available")
             
             # Download options in columns
             dl_col1, dl_col2, dl_col3 = st.columns(3)
@@ -190,16 +197,7 @@ if generate_btn and topic and openrouter_key:
                 )
             
             with dl_col2:
-                text_export = f"""LINKEDIN CONTENT - {topic.upper()}
-{'='*50}
-
-{result['blog_post']}
-
-{'='*50}
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Words: {result['word_count']} | Time: {result['execution_time']:.1f}s
-Image: {result.get('image_path', 'N/A')}
-"""
+                text_export = format_text_export(export_data)
                 st.download_button(
                     "📝 Text Format",
                     data=text_export,
@@ -238,6 +236,70 @@ Image: {result.get('image_path', 'N/A')}
             st.error(f"❌ Error generating content: {str(e)}")
             st.info("🔧 Please check your .env file has a valid OPENROUTER_API_KEY")
 
+# Bulk export of all stored runs
+# Exports are written under Streamlit's static folder so the browser download streams from disk
+# (requires server.enableStaticServing, see .streamlit/config.toml). Static files are public to
+# anyone who knows the URL, so only the newest few exports are kept, and only for a day.
+EXPORTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "exports")
+EXPORTS_URL = "app/static/exports"
+EXPORTS_KEEP = 3
+EXPORTS_TTL_SECONDS = 24 * 60 * 60
+# Streamlit refuses to serve static files over 200 MB, so ZIPs are split into smaller volumes
+MAX_STATIC_FILE_BYTES = 200 * 1024 * 1024
+EXPORT_VOLUME_BYTES = 190 * 1024 * 1024
+
+st.markdown("---")
+with st.expander("📦 Bulk Export"):
+    st.markdown("Export all stored posts as JSONL metadata and ZIP volumes of text and images.")
+
+    exp_col1, exp_col2, exp_col3 = st.columns(3)
+    with exp_col1:
+        export_start = st.date_input("From", value=None, key="export_start")
+    with exp_col2:
+        export_end = st.date_input("To", value=None, key="export_end")
+    with exp_col3:
+        export_topic = st.text_input("Topic contains", key="export_topic")
+
+    if st.button("📦 Build Export", use_container_width=True):
+        st.session_state.pop("bulk_export", None)
+        try:
+            export_name = f"linkedin_content_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+            filters = {"start_date": export_start, "end_date": export_end, "topic": export_topic}
+
+            logger.info(f"User initiated bulk export with filters: {filters}")
+            with st.spinner("Exporting stored posts..."):
+                prune_exports(EXPORTS_DIR, keep=EXPORTS_KEEP - 1, max_age_seconds=EXPORTS_TTL_SECONDS)
+                st.session_state.bulk_export = export_runs(
+                    iter_runs(**filters),
+                    EXPORTS_DIR,
+                    export_name,
+                    max_volume_bytes=EXPORT_VOLUME_BYTES
+                )
+        except Exception as e:
+            logger.error(f"Bulk export failed: {str(e)}")
+            st.error(f"❌ Error exporting content: {str(e)}")
+
+    bulk_export = st.session_state.get("bulk_export")
+    if bulk_export:
+        st.success(f"✅ Exported {bulk_export['count']} posts in {len(bulk_export['volumes'])} ZIP volume(s)")
+
+        downloads = [(bulk_export["jsonl"], "📄 JSONL Metadata")]
+        downloads += [
+            (file_name, f"🗜️ ZIP Volume {index}/{len(bulk_export['volumes'])}")
+            for index, file_name in enumerate(bulk_export["volumes"], 1)
+        ]
+        for file_name, label in downloads:
+            path = os.path.join(EXPORTS_DIR, file_name)
+            if not os.path.exists(path):
+                st.warning(f"⚠️ {file_name} has expired - build the export again")
+            elif os.path.getsize(path) > MAX_STATIC_FILE_BYTES:
+                st.info(f"{label} is too large for browser download, saved at: `{os.path.relpath(path)}`")
+            else:
+                st.markdown(
+                    f'<a href="{EXPORTS_URL}/{file_name}" download="{file_name}">{label}</a>',
+                    unsafe_allow_html=True
+                )
+
 # Footer stats
 if st.session_state.workflow_stats["total_runs"] > 0:
     stats = st.session_state.workflow_stats
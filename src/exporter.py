@@ -0,0 +1,226 @@
+import os
+import json
+import re
+import shutil
+import time
+import uuid
+import zipfile
+from datetime import datetime, date
+from typing import Dict, Iterable, Iterator, List, Optional
+from logger import setup_logger
+
+logger = setup_logger("exporter")
+
+RUNS_FILE = "generated_content/runs.jsonl"
+
+# Conservative per-entry allowance for ZIP local headers and central directory records
+ZIP_ENTRY_OVERHEAD = 512
+
+
+def save_run(record: Dict, runs_file: str = RUNS_FILE) -> Dict:
+    """Append a generated run to the runs store as one JSON line, returning the stored record"""
+    runs_dir = os.path.dirname(runs_file) or "."
+    os.makedirs(runs_dir, exist_ok=True)
+
+    stored = dict(record)
+    stored["run_id"] = uuid.uuid4().hex
+
+    # Generated image names are reused across posts, so keep a private copy per run
+    image_path = record.get("image_path") or ""
+    if image_path and os.path.exists(image_path):
+        images_dir = os.path.join(runs_dir, "images")
+        os.makedirs(images_dir, exist_ok=True)
+        extension = os.path.splitext(image_path)[1] or ".png"
+        stored_image_path = os.path.join(images_dir, f"{stored['run_id']}{extension}")
+        shutil.copyfile(image_path, stored_image_path)
+        stored["image_path"] = stored_image_path
+    else:
+        stored["image_path"] = ""
+    # The workflow reports the shared image file as its URL too, so point it at the copy
+    stored["image_url"] = stored["image_path"]
+
+    with open(runs_file, "a", encoding="utf-8") as f:
+        f.write(json.dumps(stored, ensure_ascii=False) + "\n")
+    logger.info(f"Run saved for topic: {stored.get('topic', '')}")
+    return stored
+
+
+def iter_runs(runs_file: str = RUNS_FILE,
+              start_date: Optional[date] = None,
+              end_date: Optional[date] = None,
+              topic: str = "") -> Iterator[Dict]:
+    """Yield stored runs one at a time, filtered by inclusive date range and topic substring"""
+    if not os.path.exists(runs_file):
+        return
+
+    topic_filter = topic.strip().lower()
+
+    with open(runs_file, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping malformed run on line {line_number}")
+                continue
+            if not isinstance(record, dict):
+                logger.warning(f"Skipping malformed run on line {line_number}")
+                continue
+
+            if start_date or end_date:
+                try:
+                    generated_on = datetime.fromisoformat(record.get("generated_at")).date()
+                except (TypeError, ValueError):
+                    logger.warning(f"Skipping run with invalid generated_at on line {line_number}")
+                    continue
+                if start_date and generated_on < start_date:
+                    continue
+                if end_date and generated_on > end_date:
+                    continue
+
+            if topic_filter and topic_filter not in str(record.get("topic") or "").lower():
+                continue
+
+            yield record
+
+
+def format_text_export(record: Dict) -> str:
+    """Render a run in the plain text download layout"""
+    generated_at = record.get("generated_at") or ""
+    try:
+        generated_at = datetime.fromisoformat(generated_at).strftime('%Y-%m-%d %H:%M:%S')
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        execution_time = float(record.get("execution_time") or 0.0)
+    except (TypeError, ValueError):
+        execution_time = 0.0
+
+    return f"""LINKEDIN CONTENT - {str(record.get('topic') or '').upper()}
+{'='*50}
+
+{record.get('blog_post') or ''}
+
+{'='*50}
+Generated: {generated_at}
+Words: {record.get('word_count') or 0} | Time: {execution_time:.1f}s
+Image: {record.get('image_path') or 'N/A'}
+"""
+
+
+def _archive_stem(record: Dict, index: int) -> str:
+    """Build a unique, filesystem-safe base name for a run inside the archive"""
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", str(record.get("topic") or "")).strip("_")[:50] or "untitled"
+    return f"{index:05d}_{slug}"
+
+
+def export_runs(runs: Iterable[Dict], export_dir: str, export_name: str,
+                max_volume_bytes: Optional[int] = None) -> Dict:
+    """Stream runs in a single pass to JSONL metadata and ZIP volumes of text posts and images.
+
+    A new ZIP volume is started whenever the next run would push the current one past
+    ``max_volume_bytes``; a single run larger than the limit gets a volume of its own.
+    Each JSONL line carries an ``archive_files`` entry naming its volume, post and image.
+    Files are written under temporary names and only moved into place once complete,
+    so a failed export leaves nothing behind. Returns the run count and file names.
+    """
+    os.makedirs(export_dir, exist_ok=True)
+
+    jsonl_name = f"{export_name}.jsonl"
+    volume_names: List[str] = []
+    partial_paths: List[str] = []
+
+    def partial_path(file_name: str) -> str:
+        path = os.path.join(export_dir, f".{file_name}.part")
+        partial_paths.append(path)
+        return path
+
+    def open_volume() -> zipfile.ZipFile:
+        volume_names.append(f"{export_name}.{len(volume_names) + 1:03d}.zip")
+        return zipfile.ZipFile(partial_path(volume_names[-1]), "w", compression=zipfile.ZIP_DEFLATED)
+
+    count = 0
+    zf = None
+    try:
+        with open(partial_path(jsonl_name), "w", encoding="utf-8") as jsonl_file:
+            zf = open_volume()
+            volume_entries = 0
+            central_directory = 22
+            for record in runs:
+                count += 1
+                stem = _archive_stem(record, count)
+                post_text = format_text_export(record).encode("utf-8")
+
+                image_path = record.get("image_path") or ""
+                if image_path and not os.path.exists(image_path):
+                    logger.warning(f"Image missing for export: {image_path}")
+                    image_path = ""
+                image_size = os.path.getsize(image_path) if image_path else 0
+
+                if max_volume_bytes and volume_entries:
+                    record_size = len(post_text) + image_size + 2 * ZIP_ENTRY_OVERHEAD
+                    if zf.fp.tell() + central_directory + record_size > max_volume_bytes:
+                        zf.close()
+                        zf = open_volume()
+                        volume_entries = 0
+                        central_directory = 22
+
+                archive_files = {"volume": volume_names[-1], "post": f"posts/{stem}.txt", "image": ""}
+                zf.writestr(archive_files["post"], post_text)
+                volume_entries += 1
+                central_directory += ZIP_ENTRY_OVERHEAD
+
+                if image_path:
+                    # ZipFile.write copies the file in chunks, so images are never fully loaded
+                    extension = os.path.splitext(image_path)[1] or ".png"
+                    archive_files["image"] = f"images/{stem}{extension}"
+                    zf.write(image_path, archive_files["image"],
+                             compress_type=zipfile.ZIP_STORED)
+                    central_directory += ZIP_ENTRY_OVERHEAD
+
+                jsonl_file.write(json.dumps(dict(record, archive_files=archive_files),
+                                            ensure_ascii=False) + "\n")
+            zf.close()
+    except BaseException:
+        if zf is not None:
+            zf.close()
+        for path in partial_paths:
+            if os.path.exists(path):
+                os.remove(path)
+        raise
+
+    for file_name in [jsonl_name] + volume_names:
+        os.replace(os.path.join(export_dir, f".{file_name}.part"), os.path.join(export_dir, file_name))
+
+    logger.info(f"Exported {count} runs to {export_name} ({len(volume_names)} ZIP volumes)")
+    return {"count": count, "jsonl": jsonl_name, "volumes": volume_names}
+
+
+def prune_exports(export_dir: str, keep: int, max_age_seconds: float) -> None:
+    """Delete all but the newest ``keep`` exports, and any export older than ``max_age_seconds``"""
+    if not os.path.isdir(export_dir):
+        return
+
+    # Export files share the export name up to their first dot
+    exports: Dict[str, List[str]] = {}
+    for file_name in os.listdir(export_dir):
+        if file_name.startswith("."):
+            continue
+        exports.setdefault(file_name.split(".")[0], []).append(os.path.join(export_dir, file_name))
+
+    def newest_mtime(paths: List[str]) -> float:
+        return max(os.path.getmtime(path) for path in paths)
+
+    now = time.time()
+    ordered = sorted(exports.values(), key=newest_mtime, reverse=True)
+    for index, paths in enumerate(ordered):
+        if index >= keep or now - newest_mtime(paths) > max_age_seconds:
+            for path in paths:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            logger.info(f"Pruned export: {os.path.basename(paths[0]).split('.')[0]}")
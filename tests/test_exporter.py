@@ -0,0 +1,186 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+import zipfile
+from datetime import date
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from exporter import save_run, iter_runs, export_runs, prune_exports, format_text_export
+
+class TestExporter(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up a runs store with a few stored posts"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.runs_file = os.path.join(self.tmp_dir.name, "runs.jsonl")
+        self.image_path = os.path.join(self.tmp_dir.name, "image.png")
+        self.image_bytes = b"\x89PNG test image"
+        with open(self.image_path, 'wb') as f:
+            f.write(self.image_bytes)
+        
+        runs = [
+            ("AI in healthcare", "2026-10-01T09:00:00", self.image_path),
+            ("Remote work tips", "2026-10-05T12:30:00", ""),
+            ("AI in finance", "2026-10-10T18:45:00", "missing.png"),
+        ]
+        for topic, generated_at, image_path in runs:
+            save_run({
+                "topic": topic,
+                "generated_at": generated_at,
+                "execution_time": 1.5,
+                "word_count": 3,
+                "blog_post": f"Post about {topic}",
+                "image_url": image_path,
+                "image_path": image_path,
+            }, runs_file=self.runs_file)
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def test_iter_runs_filters(self):
+        """Test stored runs are filtered by date range and topic"""
+        self.assertEqual(len(list(iter_runs(self.runs_file))), 3)
+        
+        in_range = list(iter_runs(self.runs_file, start_date=date(2026, 10, 5), end_date=date(2026, 10, 10)))
+        self.assertEqual([r["topic"] for r in in_range], ["Remote work tips", "AI in finance"])
+        
+        by_topic = list(iter_runs(self.runs_file, topic="ai in"))
+        self.assertEqual([r["topic"] for r in by_topic], ["AI in healthcare", "AI in finance"])
+        
+        self.assertEqual(list(iter_runs(os.path.join(self.tmp_dir.name, "none.jsonl"))), [])
+    
+    def test_save_run_copies_image(self):
+        """Test stored runs keep their own image copy when the source is overwritten"""
+        stored = next(iter_runs(self.runs_file))
+        
+        self.assertNotEqual(stored["image_path"], self.image_path)
+        self.assertEqual(stored["image_url"], stored["image_path"])
+        with open(self.image_path, 'wb') as f:
+            f.write(b"another post's image")
+        with open(stored["image_path"], 'rb') as f:
+            self.assertEqual(f.read(), self.image_bytes)
+        
+        missing = [r for r in iter_runs(self.runs_file) if r["topic"] == "AI in finance"][0]
+        self.assertEqual(missing["image_path"], "")
+        self.assertEqual(missing["image_url"], "")
+    
+    def test_iter_runs_skips_malformed_lines(self):
+        """Test blank, malformed and invalid-date lines are skipped"""
+        with open(self.runs_file, 'a', encoding="utf-8") as f:
+            f.write("\n")
+            f.write("{not json\n")
+            f.write("[1, 2]\n")
+            f.write(json.dumps({"topic": "No date", "generated_at": None}) + "\n")
+        
+        self.assertEqual(len(list(iter_runs(self.runs_file))), 4)
+        dated = list(iter_runs(self.runs_file, start_date=date(2026, 1, 1)))
+        self.assertEqual(len(dated), 3)
+    
+    def test_format_text_export(self):
+        """Test text export layout and tolerance of missing values"""
+        text = format_text_export({
+            "topic": "AI in healthcare",
+            "generated_at": "2026-10-01T09:00:00.123456",
+            "execution_time": 1.25,
+            "word_count": 3,
+            "blog_post": "Post body",
+            "image_path": "",
+        })
+        self.assertTrue(text.startswith("LINKEDIN CONTENT - AI IN HEALTHCARE"))
+        self.assertIn("Post body", text)
+        self.assertIn("Generated: 2026-10-01 09:00:00", text)
+        self.assertIn("Words: 3 | Time: 1.2s", text)
+        self.assertIn("Image: N/A", text)
+        
+        text = format_text_export({"topic": None, "generated_at": None, "execution_time": None})
+        self.assertIn("Time: 0.0s", text)
+    
+    def test_export_runs(self):
+        """Test single-pass export links JSONL records to archived posts and images"""
+        export_dir = os.path.join(self.tmp_dir.name, "exports")
+        result = export_runs(iter_runs(self.runs_file), export_dir, "content")
+        
+        self.assertEqual(result, {"count": 3, "jsonl": "content.jsonl", "volumes": ["content.001.zip"]})
+        self.assertEqual(sorted(os.listdir(export_dir)), ["content.001.zip", "content.jsonl"])
+        with open(os.path.join(export_dir, "content.jsonl"), encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), result["count"])
+        
+        with zipfile.ZipFile(os.path.join(export_dir, "content.001.zip")) as zf:
+            names = zf.namelist()
+            self.assertEqual(len([n for n in names if n.startswith("posts/")]), result["count"])
+            self.assertEqual(len([n for n in names if n.startswith("images/")]), 1)
+            
+            for record in records:
+                self.assertEqual(record["archive_files"]["volume"], "content.001.zip")
+                self.assertIn(record["archive_files"]["post"], names)
+                self.assertIn(f"Post about {record['topic']}", zf.read(record["archive_files"]["post"]).decode())
+            
+            self.assertEqual(records[0]["archive_files"]["image"], "images/00001_AI_in_healthcare.png")
+            self.assertEqual(zf.read(records[0]["archive_files"]["image"]), self.image_bytes)
+            self.assertEqual(records[1]["archive_files"]["image"], "")
+    
+    def test_export_runs_splits_volumes(self):
+        """Test exports over the volume limit are split, with oversized runs in their own volume"""
+        large_image = os.path.join(self.tmp_dir.name, "large.png")
+        with open(large_image, 'wb') as f:
+            f.write(os.urandom(8000))
+        save_run({"topic": "Large image", "generated_at": "2026-10-11T08:00:00",
+                  "blog_post": "Big", "image_path": large_image}, runs_file=self.runs_file)
+        
+        export_dir = os.path.join(self.tmp_dir.name, "exports")
+        max_volume_bytes = 4000
+        result = export_runs(iter_runs(self.runs_file), export_dir, "content",
+                             max_volume_bytes=max_volume_bytes)
+        
+        self.assertEqual(result["count"], 4)
+        self.assertGreater(len(result["volumes"]), 1)
+        with open(os.path.join(export_dir, "content.jsonl"), encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        
+        sizes = [os.path.getsize(os.path.join(export_dir, v)) for v in result["volumes"]]
+        self.assertEqual(len([size for size in sizes if size > max_volume_bytes]), 1)
+        for volume in result["volumes"]:
+            path = os.path.join(export_dir, volume)
+            in_volume = [r for r in records if r["archive_files"]["volume"] == volume]
+            self.assertTrue(in_volume)
+            if os.path.getsize(path) > max_volume_bytes:
+                self.assertEqual([r["topic"] for r in in_volume], ["Large image"])
+            with zipfile.ZipFile(path) as zf:
+                for record in in_volume:
+                    self.assertIn(record["archive_files"]["post"], zf.namelist())
+    
+    def test_export_runs_removes_partial_files_on_failure(self):
+        """Test a failed export leaves no files behind"""
+        def failing_runs():
+            yield from iter_runs(self.runs_file)
+            raise RuntimeError("store read failed")
+        
+        export_dir = os.path.join(self.tmp_dir.name, "exports")
+        with self.assertRaises(RuntimeError):
+            export_runs(failing_runs(), export_dir, "content")
+        self.assertEqual(os.listdir(export_dir), [])
+    
+    def test_prune_exports(self):
+        """Test only the newest exports within the age limit are kept"""
+        export_dir = os.path.join(self.tmp_dir.name, "exports")
+        for age, name in enumerate(["newest", "middle", "oldest"]):
+            export_runs(iter_runs(self.runs_file), export_dir, name)
+            for file_name in os.listdir(export_dir):
+                if file_name.startswith(name + "."):
+                    path = os.path.join(export_dir, file_name)
+                    os.utime(path, (os.path.getmtime(path) - age * 3600,) * 2)
+        
+        prune_exports(export_dir, keep=2, max_age_seconds=24 * 3600)
+        self.assertEqual(sorted(os.listdir(export_dir)),
+                         ["middle.001.zip", "middle.jsonl", "newest.001.zip", "newest.jsonl"])
+        
+        prune_exports(export_dir, keep=2, max_age_seconds=1800)
+        self.assertEqual(sorted(os.listdir(export_dir)), ["newest.001.zip", "newest.jsonl"])
+
+if __name__ == '__main__':
+    unittest.main()